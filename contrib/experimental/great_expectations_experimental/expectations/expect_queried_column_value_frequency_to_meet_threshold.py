@@ -4,6 +4,7 @@ For detailed information on QueryExpectations, please see:
     https://docs.greatexpectations.io/docs/guides/expectations/creating_custom_expectations/how_to_create_custom_query_expectations
 """
 
+from itertools import repeat
 from typing import Optional, Union
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
@@ -53,21 +54,34 @@ class ExpectQueriedColumnValueFrequencyToMeetThreshold(QueryExpectation):
         self, configuration: Optional[ExpectationConfiguration]
     ) -> None:
         super().validate_configuration(configuration)
+        if configuration is None:
+            configuration = self.configuration
+
         value = configuration["kwargs"].get("value")
         threshold = configuration["kwargs"].get("threshold")
 
         try:
             assert value is not None, "'value' must be specified"
-            assert (isinstance(threshold, (int, float)) and 0 < threshold <= 1) or (
-                isinstance(threshold, list)
-                and all(isinstance(x, (int, float)) for x in threshold)
-                and all([0 < x <= 1 for x in threshold])
-                and 0 < sum(threshold) <= 1
-            ), "'threshold' must be 1, a float between 0 and 1, or a list of floats whose sum is between 0 and 1"
             if isinstance(threshold, list):
+                threshold_sum = 0
+                for x in threshold:
+                    assert (
+                        isinstance(x, (int, float)) and 0 < x <= 1
+                    ), "'threshold' entries must be floats between 0 and 1"
+                    threshold_sum += x
+                assert (
+                    0 < threshold_sum <= 1
+                ), "the sum of 'threshold' entries must be between 0 and 1"
                 assert isinstance(value, list) and len(value) == len(
                     threshold
                 ), "'value' and 'threshold' must contain the same number of arguments"
+            else:
+                assert (
+                    isinstance(threshold, (int, float)) and 0 < threshold <= 1
+                ), "'threshold' must be 1, a float between 0 and 1, or a list of floats whose sum is between 0 and 1"
+                assert not isinstance(
+                    value, list
+                ), "'value' must be a single value when 'threshold' is a number"
         except AssertionError as e:
             raise InvalidExpectationConfigurationError(str(e))
 
@@ -79,30 +93,50 @@ class ExpectQueriedColumnValueFrequencyToMeetThreshold(QueryExpectation):
         execution_engine: ExecutionEngine = None,
     ) -> Union[ExpectationValidationResult, dict]:
 
+        if isinstance(configuration["kwargs"].get("value"), list):
+            return self._validate_list(configuration, metrics)
+
+        return self._validate_scalar(configuration, metrics)
+
+    @staticmethod
+    def _get_query_result(metrics: dict) -> dict:
+        query_result = metrics.get("query.column")
+        if not isinstance(query_result, dict):
+            query_result = dict(query_result)
+
+        return query_result
+
+    def _validate_list(
+        self, configuration: ExpectationConfiguration, metrics: dict
+    ) -> dict:
+
         value = configuration["kwargs"].get("value")
         threshold = configuration["kwargs"].get("threshold")
-        query_result = metrics.get("query.column")
-        query_result = dict(query_result)
-
-        if isinstance(value, list):
-            success = all(
-                query_result[value[i]] >= threshold[i] for i in range(len(value))
-            )
-
-            return {
-                "success": success,
-                "result": {
-                    "observed_value": [
-                        query_result[value[i]] for i in range(len(value))
-                    ]
-                },
-            }
+        query_result = self._get_query_result(metrics)
+
+        # Values that never occur in the column are absent from the grouped query result.
+        observed_value = list(map(query_result.get, value, repeat(0.0)))
+        success = all(o >= t for o, t in zip(observed_value, threshold))
+
+        return {
+            "success": success,
+            "result": {"observed_value": observed_value},
+        }
+
+    def _validate_scalar(
+        self, configuration: ExpectationConfiguration, metrics: dict
+    ) -> dict:
+
+        value = configuration["kwargs"].get("value")
+        threshold = configuration["kwargs"].get("threshold")
+        query_result = self._get_query_result(metrics)
 
-        success = query_result[value] >= threshold
+        observed_value = query_result.get(value, 0.0)
+        success = observed_value >= threshold
 
         return {
             "success": success,
-            "result": {"observed_value": query_result[value]},
+            "result": {"observed_value": observed_value},
         }
 
     examples = [
@@ -141,6 +175,30 @@ class ExpectQueriedColumnValueFrequencyToMeetThreshold(QueryExpectation):
                     "out": {"success": False},
                     "only_for": ["sqlite", "spark"],
                 },
+                {
+                    "title": "missing_single_value_negative_test",
+                    "exact_match_out": False,
+                    "include_in_gallery": True,
+                    "in": {
+                        "column": "col2",
+                        "value": "c",
+                        "threshold": 0.1,
+                    },
+                    "out": {"success": False},
+                    "only_for": ["sqlite", "spark"],
+                },
+                {
+                    "title": "missing_value_negative_test",
+                    "exact_match_out": False,
+                    "include_in_gallery": True,
+                    "in": {
+                        "column": "col2",
+                        "value": ["a", "c"],
+                        "threshold": [0.6, 0.2],
+                    },
+                    "out": {"success": False},
+                    "only_for": ["sqlite", "spark"],
+                },
                 {
                     "title": "multi_value_positive_test",
                     "exact_match_out": False,
@@ -47,6 +47,9 @@ class ExpectQueriedTableRowCountToBe(QueryExpectation):
         self, configuration: Optional[ExpectationConfiguration]
     ) -> None:
         super().validate_configuration(configuration)
+        if configuration is None:
+            configuration = self.configuration
+
         value = configuration["kwargs"].get("value")
 
         try:
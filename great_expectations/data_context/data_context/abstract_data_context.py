@@ -7,6 +7,7 @@ import os
 import sys
 import uuid
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -81,6 +82,54 @@ from great_expectations.core.usage_statistics.usage_statistics import (  # isort
 logger = logging.getLogger(__name__)
 yaml = YAMLHandler()
 
+# Parsed global config files, keyed by path and invalidated when the file's stat signature changes.
+_CONFIG_CACHE: Dict[
+    str, Tuple[Tuple[int, int, int, int], configparser.ConfigParser]
+] = {}
+
+
+def _load_config(config_path: str) -> Optional[configparser.ConfigParser]:
+    """
+    Parse a global config file, reusing the previous parse if the file has not changed on disk.
+
+    Args:
+        config_path (str): path to the global config file
+
+    Returns:
+        ConfigParser for the file, or None if the file cannot be read
+    """
+    # A single stat() skips missing paths (the common case) without an open() attempt and validates the cached parse.
+    # The inode and ctime catch same-size edits that coarse mtimes miss, including files replaced atomically.
+    try:
+        stat_result: os.stat_result = os.stat(config_path)
+    except OSError:
+        _CONFIG_CACHE.pop(config_path, None)
+        return None
+
+    file_signature: Tuple[int, int, int, int] = (
+        stat_result.st_mtime_ns,
+        stat_result.st_ctime_ns,
+        stat_result.st_size,
+        stat_result.st_ino,
+    )
+    cached: Optional[
+        Tuple[Tuple[int, int, int, int], configparser.ConfigParser]
+    ] = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == file_signature:
+        return cached[1]
+
+    config: configparser.ConfigParser = configparser.ConfigParser()
+    config.BOOLEAN_STATES = AbstractDataContext._GLOBAL_CONFIG_BOOLEAN_STATES
+    try:
+        with open(config_path) as f:
+            config.read_file(f, source=config_path)
+    except OSError:
+        _CONFIG_CACHE.pop(config_path, None)
+        return None
+
+    _CONFIG_CACHE[config_path] = (file_signature, config)
+    return config
+
 
 class AbstractDataContext(ABC):
     """
@@ -92,7 +141,16 @@ class AbstractDataContext(ABC):
 
     # NOTE: <DataContextRefactor> These can become a property like ExpectationsStore.__name__ or placed in a separate
     # test_yml_config module so AbstractDataContext is not so cluttered.
-    FALSEY_STRINGS = ["FALSE", "false", "False", "f", "F", "0"]
+    FALSEY_STRINGS = frozenset(["FALSE", "false", "False", "f", "F", "0"])
+    # Boolean values accepted in global config files; read-only because it is shared by every parsed config.
+    _GLOBAL_CONFIG_BOOLEAN_STATES = MappingProxyType(
+        {
+            **configparser.ConfigParser.BOOLEAN_STATES,
+            **{falsey_string: False for falsey_string in FALSEY_STRINGS},
+            "TRUE": True,
+            "True": True,
+        }
+    )
     GLOBAL_CONFIG_PATHS = [
         os.path.expanduser("~/.great_expectations/great_expectations.conf"),
         "/etc/great_expectations.conf",
@@ -1074,12 +1132,19 @@ class AbstractDataContext(ABC):
         assert (conf_file_section and conf_file_option) or (
             not conf_file_section and not conf_file_option
         ), "Must pass both 'conf_file_section' and 'conf_file_option' or neither."
-        if environment_variable and os.environ.get(environment_variable, False):
-            return os.environ.get(environment_variable)
+        if environment_variable:
+            environment_variable_value: Optional[str] = os.environ.get(
+                environment_variable
+            )
+            if environment_variable_value:
+                return environment_variable_value
         if conf_file_section and conf_file_option:
             for config_path in AbstractDataContext.GLOBAL_CONFIG_PATHS:
-                config: configparser.ConfigParser = configparser.ConfigParser()
-                config.read(config_path)
+                config: Optional[configparser.ConfigParser] = _load_config(
+                    config_path
+                )
+                if config is None:
+                    continue
                 config_value: Optional[str] = config.get(
                     conf_file_section, conf_file_option, fallback=None
                 )
@@ -1177,6 +1242,8 @@ class AbstractDataContext(ABC):
             DataContextConfig with the appropriate overrides
         """
         validation_errors: dict = {}
+        # The context mutates its config in place (datasources, stores, ...), so it must own a full copy even when
+        # no override applies; otherwise changes would leak into the caller's config.
         config_with_global_config_overrides: DataContextConfig = copy.deepcopy(config)
         usage_stats_opted_out: bool = self._check_global_usage_statistics_opt_out()
         # if usage_stats_opted_out then usage_statistics is false
@@ -1276,26 +1343,32 @@ class AbstractDataContext(ABC):
         """
         # NOTE: <DataContextRefactor> Refactor so that opt_out is no longer used, and we don't have to flip boolean in
         # our minds.
-        if os.environ.get("GE_USAGE_STATS", False):
-            ge_usage_stats = os.environ.get("GE_USAGE_STATS")
+        ge_usage_stats: Optional[str] = os.environ.get("GE_USAGE_STATS")
+        if ge_usage_stats:
             if ge_usage_stats in AbstractDataContext.FALSEY_STRINGS:
                 return True
+            elif (
+                configparser.ConfigParser.BOOLEAN_STATES.get(ge_usage_stats.lower())
+                is True
+            ):
+                # An explicit opt-in takes precedence over global config files, so there is no need to read them.
+                return False
             else:
+                truthy_strings: List[str] = sorted(
+                    state
+                    for state, enabled in configparser.ConfigParser.BOOLEAN_STATES.items()
+                    if enabled
+                )
                 logger.warning(
-                    "GE_USAGE_STATS environment variable must be one of: {}".format(
-                        AbstractDataContext.FALSEY_STRINGS
+                    "GE_USAGE_STATS environment variable must be one of: {} to disable usage statistics, "
+                    "or one of: {} (case-insensitive) to enable them".format(
+                        sorted(AbstractDataContext.FALSEY_STRINGS), truthy_strings
                     )
                 )
         for config_path in AbstractDataContext.GLOBAL_CONFIG_PATHS:
-            config = configparser.ConfigParser()
-            states = config.BOOLEAN_STATES
-            for falsey_string in AbstractDataContext.FALSEY_STRINGS:
-                states[falsey_string] = False
-
-            states["TRUE"] = True
-            states["True"] = True
-            config.BOOLEAN_STATES = states
-            config.read(config_path)
+            config: Optional[configparser.ConfigParser] = _load_config(config_path)
+            if config is None:
+                continue
             try:
                 if config.getboolean("anonymous_usage_statistics", "enabled") is False:
                     # If stats are disabled, then opt out is true
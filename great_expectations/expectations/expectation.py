@@ -1844,6 +1844,8 @@ class QueryExpectation(TableExpectation, ABC):
               UserWarning: If query is not parameterized, and/or row_condition is passed.
         """
         super().validate_configuration(configuration)
+        if configuration is None:
+            configuration = self.configuration
 
         query: str = configuration.kwargs.get("query") or self.default_kwarg_values.get(
             "query"
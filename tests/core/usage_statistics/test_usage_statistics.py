@@ -206,6 +206,40 @@ def test_opt_out_yml(tmp_path_factory, monkeypatch):
     )
 
 
+@pytest.mark.base_data_context
+def test_global_config_overrides_do_not_mutate_caller_config(
+    in_memory_data_context_config_usage_stats_enabled, tmp_path_factory, monkeypatch
+):
+    monkeypatch.delenv(
+        "GE_USAGE_STATS", raising=False
+    )  # Undo the project-wide test default
+    monkeypatch.delenv("GE_DATA_CONTEXT_ID", raising=False)
+    monkeypatch.delenv("GE_USAGE_STATISTICS_URL", raising=False)
+    home_config_dir = tmp_path_factory.mktemp("home_dir")
+    home_config_dir = str(home_config_dir)
+    etc_config_dir = tmp_path_factory.mktemp("etc")
+    etc_config_dir = str(etc_config_dir)
+    config_dirs = [home_config_dir, etc_config_dir]
+    config_dirs = [
+        os.path.join(config_dir, "great_expectations.conf")
+        for config_dir in config_dirs
+    ]
+
+    project_config = in_memory_data_context_config_usage_stats_enabled
+    with mock.patch(
+        "great_expectations.data_context.AbstractDataContext.GLOBAL_CONFIG_PATHS",
+        config_dirs,
+    ):
+        context = BaseDataContext(project_config)
+        assert context._check_global_usage_statistics_opt_out() is False
+
+        context.add_datasource("my_datasource", class_name="PandasDatasource")
+
+    assert "my_datasource" in context.config.datasources
+    assert project_config.datasources == {}
+    assert context._project_config is not project_config
+
+
 # Test precedence: environment variable > home folder > /etc > yml
 @pytest.mark.base_data_context
 def test_opt_out_env_var_overrides_home_folder(
@@ -287,6 +321,88 @@ def test_opt_out_env_var_overrides_etc(
         assert project_config.anonymous_usage_statistics.enabled is False
 
 
+@pytest.mark.base_data_context
+def test_truthy_env_var_overrides_opt_out_in_etc_and_home_folder(
+    in_memory_data_context_config_usage_stats_enabled, tmp_path_factory, monkeypatch
+):
+    monkeypatch.delenv(
+        "GE_USAGE_STATS", raising=False
+    )  # Undo the project-wide test default
+    home_config_dir = tmp_path_factory.mktemp("home_dir")
+    home_config_dir = str(home_config_dir)
+    etc_config_dir = tmp_path_factory.mktemp("etc")
+    etc_config_dir = str(etc_config_dir)
+    config_dirs = [home_config_dir, etc_config_dir]
+    config_dirs = [
+        os.path.join(config_dir, "great_expectations.conf")
+        for config_dir in config_dirs
+    ]
+
+    disabled_config = configparser.ConfigParser()
+    disabled_config["anonymous_usage_statistics"] = {"enabled": "False"}
+
+    for config_path in config_dirs:
+        with open(config_path, "w") as configfile:
+            disabled_config.write(configfile)
+
+    monkeypatch.setenv("GE_USAGE_STATS", "true")
+
+    with mock.patch(
+        "great_expectations.data_context.AbstractDataContext.GLOBAL_CONFIG_PATHS",
+        config_dirs,
+    ):
+        context = BaseDataContext(
+            deepcopy(in_memory_data_context_config_usage_stats_enabled)
+        )
+        assert context._check_global_usage_statistics_opt_out() is False
+        project_config = context._project_config
+        assert project_config.anonymous_usage_statistics.enabled is True
+
+
+@pytest.mark.base_data_context
+def test_unrecognized_env_var_does_not_override_opt_out_in_etc(
+    in_memory_data_context_config_usage_stats_enabled,
+    tmp_path_factory,
+    monkeypatch,
+    caplog,
+):
+    monkeypatch.delenv(
+        "GE_USAGE_STATS", raising=False
+    )  # Undo the project-wide test default
+    home_config_dir = tmp_path_factory.mktemp("home_dir")
+    home_config_dir = str(home_config_dir)
+    etc_config_dir = tmp_path_factory.mktemp("etc")
+    etc_config_dir = str(etc_config_dir)
+    config_dirs = [home_config_dir, etc_config_dir]
+    config_dirs = [
+        os.path.join(config_dir, "great_expectations.conf")
+        for config_dir in config_dirs
+    ]
+
+    disabled_config = configparser.ConfigParser()
+    disabled_config["anonymous_usage_statistics"] = {"enabled": "False"}
+
+    with open(
+        os.path.join(etc_config_dir, "great_expectations.conf"), "w"
+    ) as configfile:
+        disabled_config.write(configfile)
+
+    monkeypatch.setenv("GE_USAGE_STATS", "maybe")
+
+    with mock.patch(
+        "great_expectations.data_context.AbstractDataContext.GLOBAL_CONFIG_PATHS",
+        config_dirs,
+    ):
+        context = BaseDataContext(
+            deepcopy(in_memory_data_context_config_usage_stats_enabled)
+        )
+        assert context._check_global_usage_statistics_opt_out() is True
+        project_config = context._project_config
+        assert project_config.anonymous_usage_statistics.enabled is False
+
+    assert "GE_USAGE_STATS environment variable must be one of" in caplog.text
+
+
 def test_opt_out_env_var_overrides_yml(tmp_path_factory, monkeypatch):
     monkeypatch.delenv(
         "GE_USAGE_STATS", raising=False
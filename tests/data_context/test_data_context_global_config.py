@@ -0,0 +1,90 @@
+import configparser
+import os
+from unittest import mock
+
+import pytest
+
+from great_expectations.data_context.data_context.abstract_data_context import (
+    _CONFIG_CACHE,
+    AbstractDataContext,
+)
+
+
+def _write_global_config(path: str, data_context_id: str) -> None:
+    config = configparser.ConfigParser()
+    config["anonymous_usage_statistics"] = {"data_context_id": data_context_id}
+    with open(path, "w") as configfile:
+        config.write(configfile)
+
+
+def _get_data_context_id_from_global_config() -> str:
+    return AbstractDataContext._get_global_config_value(
+        environment_variable="GE_DATA_CONTEXT_ID",
+        conf_file_section="anonymous_usage_statistics",
+        conf_file_option="data_context_id",
+    )
+
+
+@pytest.mark.unit
+def test_get_global_config_value_reads_rewritten_conf_file(
+    mocked_global_config_dirs, monkeypatch
+):
+    monkeypatch.delenv("GE_DATA_CONTEXT_ID", raising=False)
+    (
+        mock_global_config_dot_dir,
+        mock_global_config_etc_dir,
+        mock_global_config_paths,
+    ) = mocked_global_config_dirs
+    config_path: str = mock_global_config_paths[0]
+
+    old_data_context_id = "6a52bdfa-e182-455b-a825-e69f076e67d6"
+    new_data_context_id = "d8dc7e0b-9bcd-4e38-9a7f-4c1c4e1d8e0a"
+
+    _write_global_config(config_path, old_data_context_id)
+    with mock.patch(
+        "great_expectations.data_context.data_context.AbstractDataContext.GLOBAL_CONFIG_PATHS",
+        mock_global_config_paths,
+    ):
+        assert _get_data_context_id_from_global_config() == old_data_context_id
+
+        # Same-length edit saved by replacing the file, with an unchanged mtime as on filesystems with coarse
+        # timestamps.
+        stat_result: os.stat_result = os.stat(config_path)
+        replacement_path: str = f"{config_path}.tmp"
+        _write_global_config(replacement_path, new_data_context_id)
+        os.utime(
+            replacement_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns)
+        )
+        os.replace(replacement_path, config_path)
+        assert os.stat(config_path).st_size == stat_result.st_size
+        assert os.stat(config_path).st_mtime_ns == stat_result.st_mtime_ns
+
+        assert _get_data_context_id_from_global_config() == new_data_context_id
+
+
+@pytest.mark.unit
+def test_get_global_config_value_drops_deleted_conf_file_from_cache(
+    mocked_global_config_dirs, monkeypatch
+):
+    monkeypatch.delenv("GE_DATA_CONTEXT_ID", raising=False)
+    (
+        mock_global_config_dot_dir,
+        mock_global_config_etc_dir,
+        mock_global_config_paths,
+    ) = mocked_global_config_dirs
+    config_path: str = mock_global_config_paths[0]
+
+    data_context_id = "6a52bdfa-e182-455b-a825-e69f076e67d6"
+
+    _write_global_config(config_path, data_context_id)
+    with mock.patch(
+        "great_expectations.data_context.data_context.AbstractDataContext.GLOBAL_CONFIG_PATHS",
+        mock_global_config_paths,
+    ):
+        assert _get_data_context_id_from_global_config() == data_context_id
+        assert config_path in _CONFIG_CACHE
+
+        os.remove(config_path)
+
+        assert _get_data_context_id_from_global_config() is None
+        assert config_path not in _CONFIG_CACHE
@@ -6,7 +6,11 @@ from contrib.experimental.great_expectations_experimental.expectations.expect_qu
     ExpectQueriedColumnValueFrequencyToMeetThreshold,
 )
 from great_expectations.core.batch import BatchRequest, RuntimeBatchRequest
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.data_context import DataContext
+from great_expectations.exceptions.exceptions import (
+    InvalidExpectationConfigurationError,
+)
 from great_expectations.self_check.util import build_spark_validator_with_data
 from great_expectations.validator.validator import (
     ExpectationValidationResult,
@@ -292,3 +296,93 @@ def test_expect_queried_column_value_frequency_to_meet_threshold_sqlite_multi_va
         0.6393939393939394,
         0.3606060606060606,
     ]
+
+
+@pytest.mark.unit
+def test_expect_queried_column_value_frequency_to_meet_threshold_rejects_list_value_with_scalar_threshold():
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_queried_column_value_frequency_to_meet_threshold",
+        kwargs={
+            "column": "Sex",
+            "value": ["male", "female"],
+            "threshold": 0.5,
+        },
+    )
+
+    with pytest.raises(InvalidExpectationConfigurationError) as e:
+        ExpectQueriedColumnValueFrequencyToMeetThreshold(configuration)
+
+    assert "'value' must be a single value when 'threshold' is a number" in str(
+        e.value
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "threshold,error_message",
+    [
+        ([0.5, 1.5], "'threshold' entries must be floats between 0 and 1"),
+        ([0.5, 0], "'threshold' entries must be floats between 0 and 1"),
+        ([0.5, "0.2"], "'threshold' entries must be floats between 0 and 1"),
+        ([0.6, 0.6], "the sum of 'threshold' entries must be between 0 and 1"),
+    ],
+)
+def test_expect_queried_column_value_frequency_to_meet_threshold_rejects_invalid_list_threshold(
+    threshold, error_message
+):
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_queried_column_value_frequency_to_meet_threshold",
+        kwargs={
+            "column": "Sex",
+            "value": ["male", "female"],
+            "threshold": threshold,
+        },
+    )
+
+    with pytest.raises(InvalidExpectationConfigurationError) as e:
+        ExpectQueriedColumnValueFrequencyToMeetThreshold(configuration)
+
+    assert error_message in str(e.value)
+
+
+@pytest.mark.unit
+def test_expect_queried_column_value_frequency_to_meet_threshold_dispatches_on_passed_configuration():
+    expectation = ExpectQueriedColumnValueFrequencyToMeetThreshold(
+        ExpectationConfiguration(
+            expectation_type="expect_queried_column_value_frequency_to_meet_threshold",
+            kwargs={"column": "Sex", "value": "male", "threshold": 0.5},
+        )
+    )
+    multi_value_configuration = ExpectationConfiguration(
+        expectation_type="expect_queried_column_value_frequency_to_meet_threshold",
+        kwargs={
+            "column": "Sex",
+            "value": ["male", "female"],
+            "threshold": [0.6, 0.3],
+        },
+    )
+
+    result = expectation._validate(
+        configuration=multi_value_configuration,
+        metrics={"query.column": [("male", 0.65), ("female", 0.35)]},
+    )
+
+    assert result == {"success": True, "result": {"observed_value": [0.65, 0.35]}}
+
+
+def test_expect_queried_column_value_frequency_to_meet_threshold_sqlite_missing_value(
+    titanic_v013_multi_datasource_pandas_and_sqlalchemy_execution_engine_data_context_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_v013_multi_datasource_pandas_and_sqlalchemy_execution_engine_data_context_with_checkpoints_v1_with_empty_store_stats_enabled
+
+    validator: Validator = context.get_validator(batch_request=sqlite_batch_request)
+
+    result: ExpectationValidationResult = (
+        validator.expect_queried_column_value_frequency_to_meet_threshold(
+            column="Sex",
+            value="unknown",
+            threshold=0.1,
+        )
+    )
+
+    assert result["success"] == False and result["result"]["observed_value"] == 0.0